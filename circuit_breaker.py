@@ -0,0 +1,122 @@
+"""
+StandX API Backoff and Circuit Breaker
+"""
+from typing import Any, Callable, Dict
+import threading
+import time
+import requests
+
+from perp_http import HTTPError
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is skipped because its endpoint is backing off"""
+    def __init__(self, endpoint: str, retry_in: float):
+        super().__init__(f"{endpoint} is backing off, retry in {retry_in:.1f}s")
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+
+
+def is_retryable(error: Exception) -> bool:
+    """
+    Whether a failure is worth backing off on.
+
+    Rate limits (429), server errors (5xx) and network errors are transient;
+    other 4xx responses are client errors that a retry won't fix.
+    """
+    if isinstance(error, HTTPError):
+        return error.status_code == 429 or error.status_code >= 500
+    return isinstance(error, requests.RequestException)
+
+
+class CircuitBreaker:
+    """Per-endpoint exponential backoff with a half-open circuit breaker"""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        open_seconds: float = 30.0,
+        base_delay: float = 0.5,
+        max_delay: float = 60.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize CircuitBreaker.
+
+        Args:
+            failure_threshold: Consecutive failures before the circuit opens
+            open_seconds: How long an open circuit skips calls
+            base_delay: Backoff after the first failure (doubles per failure)
+            max_delay: Upper bound on the backoff delay
+            clock: Monotonic time source in seconds
+        """
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._failures: Dict[str, int] = {}
+        self._retry_at: Dict[str, float] = {}
+
+    def call(self, endpoint: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Call func unless endpoint is backing off.
+
+        Once the backoff/open period has elapsed the next call is a trial:
+        success closes the circuit, failure re-opens it.
+
+        Raises:
+            CircuitOpenError: If endpoint is still backing off
+        """
+        with self._lock:
+            retry_in = self._retry_at.get(endpoint, 0.0) - self._clock()
+        if retry_in > 0:
+            raise CircuitOpenError(endpoint, retry_in)
+
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            if is_retryable(e):
+                self._record_failure(endpoint)
+            raise
+
+        with self._lock:
+            self._failures.pop(endpoint, None)
+            self._retry_at.pop(endpoint, None)
+        return result
+
+    def cooldown(self) -> float:
+        """Seconds until every endpoint accepts calls again (0 if none is backing off)."""
+        now = self._clock()
+        with self._lock:
+            return max([retry_at - now for retry_at in self._retry_at.values()] + [0.0])
+
+    def _record_failure(self, endpoint: str):
+        with self._lock:
+            failures = self._failures.get(endpoint, 0) + 1
+            self._failures[endpoint] = failures
+
+            if failures >= self.failure_threshold:
+                delay = self.open_seconds
+            else:
+                delay = min(self.max_delay, self.base_delay * 2 ** failures)
+            self._retry_at[endpoint] = self._clock() + delay
+
+
+class GuardedClient:
+    """Proxy that routes every StandXPerpHTTP method call through a CircuitBreaker"""
+
+    def __init__(self, client: Any, breaker: CircuitBreaker):
+        self._client = client
+        self._breaker = breaker
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+
+        def guarded(*args, **kwargs):
+            return self._breaker.call(name, attr, *args, **kwargs)
+        return guarded
@@ -1,22 +1,42 @@
 import os
+import re
 import time
-import json
+import atexit
+import orjson
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 import base64
 import base58
-from typing import Dict, Any, Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Set, Tuple
 from dotenv import load_dotenv
 
-from eth_account import Account
-from eth_account.messages import encode_defunct
+from eth_keys import keys
+from eth_utils import keccak
 from datetime import datetime
+from decimal import Decimal, ROUND_DOWN, ROUND_UP
 
 # StandX libraries
-from perp_http import StandXPerpHTTP
+from perp_http import StandXPerpHTTP, create_session
+from perp_ws import StandXPriceStream
+from circuit_breaker import CircuitBreaker, CircuitOpenError, GuardedClient
 from perps_auth import StandXAuth, Chain
 
 # Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Records are formatted by the QueueHandler and written to stderr by a background
+# listener thread, so logging never blocks the trading loop on I/O.
+_log_queue = queue.SimpleQueue()
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[QueueHandler(_log_queue)]
+)
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger("StandXBot")
 
 # Load environment variables
@@ -25,6 +45,53 @@ load_dotenv()
 PRIVATE_KEY_HEX = os.getenv("WALLET_PRIVATE_KEY")
 API_BASE_URL = os.getenv("STANDX_API_URL", "https://perps.standx.com")
 GEO_API_URL = os.getenv("STANDX_GEO_URL", "https://geo.standx.com")
+WS_STREAM_URL = os.getenv("STANDX_WS_URL", "wss://perps.standx.com/ws-stream/v1")
+
+# Shared HTTP session: keeps connections to StandX (perps, geo and auth) alive across all API calls
+HTTP_SESSION = create_session(API_BASE_URL, GEO_API_URL)
+atexit.register(HTTP_SESSION.close)
+
+# Worker pool for issuing independent API calls concurrently over the shared session.
+# Its size bounds in-flight requests (StandX caps order placement at ~25/s).
+MAX_CONCURRENT_REQUESTS = 10
+EXECUTOR = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS, thread_name_prefix="standx-io")
+atexit.register(EXECUTOR.shutdown, wait=False)
+SHUTDOWN_IO_TIMEOUT = 15  # Max seconds to wait for in-flight API calls before the shutdown cancel
+
+# API calls still running on EXECUTOR; Ctrl+C only interrupts the main thread,
+# so shutdown waits for these before cancelling whatever they placed
+_pending_io: Set[Future] = set()
+_pending_io_lock = threading.Lock()
+
+def submit_io(fn, *args, **kwargs) -> Future:
+    """
+    Submits an API call to EXECUTOR, tracked until it completes.
+    """
+    future = EXECUTOR.submit(fn, *args, **kwargs)
+    with _pending_io_lock:
+        _pending_io.add(future)
+    future.add_done_callback(_discard_pending_io)
+    return future
+
+def _discard_pending_io(future: Future):
+    with _pending_io_lock:
+        _pending_io.discard(future)
+
+def wait_for_pending_io(timeout: Optional[float] = None) -> bool:
+    """
+    Waits for every tracked API call to finish.
+    Returns False if some were still running after timeout.
+    """
+    with _pending_io_lock:
+        pending = list(_pending_io)
+    _, not_done = wait(pending, timeout=timeout)
+    return not not_done
+
+# Parsed wallet keys, keyed by private key hex
+_wallet_keys: Dict[str, keys.PrivateKey] = {}
+
+# EIP-191 personal_sign prefix (followed by the message length in bytes)
+EIP191_PREFIX = b"\x19Ethereum Signed Message:\n"
 
 def get_signer(private_key_hex: str):
     """
@@ -34,17 +101,25 @@ def get_signer(private_key_hex: str):
     if private_key_hex.startswith("0x"):
         private_key_hex = private_key_hex[2:]
     
-    account = Account.from_key(private_key_hex)
+    # Parse the key once; later logins reuse the same key object
+    private_key = _wallet_keys.get(private_key_hex)
+    if private_key is None:
+        private_key = keys.PrivateKey(bytes.fromhex(private_key_hex))
+        _wallet_keys[private_key_hex] = private_key
     
     def sign_message(message: str) -> str:
         # StandX requires signing the message directly (sometimes needs EIP-191, sometimes raw).
         # Based on docs/examples usually it is standard personal_sign (EIP-191) for EVM.
         # The auth module passes the message string.
-        msg_encoded = encode_defunct(text=message)
-        signed = account.sign_message(msg_encoded)
-        return "0x" + signed.signature.hex()
+        # Hash and sign the EIP-191 digest directly (same result as eth_account's sign_message).
+        msg_bytes = message.encode("utf-8")
+        msg_hash = keccak(EIP191_PREFIX + str(len(msg_bytes)).encode() + msg_bytes)
+        signature = private_key.sign_msg_hash(msg_hash)
+        # r || s || v with v in {27, 28}
+        signature_bytes = signature.to_bytes()[:64] + bytes([signature.v + 27])
+        return "0x" + signature_bytes.hex()
         
-    return account.address, sign_message
+    return private_key.public_key.to_checksum_address(), sign_message
 
 def check_connection():
     """
@@ -57,7 +132,7 @@ def check_connection():
 
     try:
         logger.info("Initializing StandX Client...")
-        client = StandXPerpHTTP(base_url=API_BASE_URL, geo_url=GEO_API_URL)
+        client = StandXPerpHTTP(base_url=API_BASE_URL, geo_url=GEO_API_URL, session=HTTP_SESSION)
         
         # 1. Health Check - SKIPPED (User reported 404)
         # logger.info("Checking API Health...")
@@ -71,7 +146,7 @@ def check_connection():
         # is done via wallet signature (EVM/Solana).
         # We need to instantiate StandXAuth. If we don't pass a key, it generates a new ephemeral one.
         # This ephemeral key is used to sign API requests AFTER login.
-        auth = StandXAuth() 
+        auth = StandXAuth(session=HTTP_SESSION)
         
         address, sign_func = get_signer(PRIVATE_KEY_HEX)
         logger.info(f"Wallet Address: {address}")
@@ -87,7 +162,7 @@ def check_connection():
         
         logger.info("-" * 30)
         logger.info("ACCOUNT BALANCE:")
-        logger.info(json.dumps(balance, indent=2))
+        logger.info(orjson.dumps(balance, option=orjson.OPT_INDENT_2).decode())
         logger.info("-" * 30)
         
         # 4. Check Open Orders (Just to see)
@@ -98,20 +173,61 @@ def check_connection():
         logger.info("CONNECTION VERIFICATION COMPLETED SUCCESSFULLY.")
         
     except Exception as e:
-        logger.error(f"An error occurred during verification: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"An error occurred during verification: {e}")
 
 # --- CONFIGURATION TRADING ---
 SYMBOL = "BTC-DUSD"
 SPREAD_BPS = 8          # 8 bps = 0.08% (Target < 10 bps)
 ORDER_SIZE = "0.0015"    # BTC Size (Adjust based on your balance!)
 REFRESH_RATE = 30       # Seconds between updates
+CANCEL_BATCH_SIZE = 50  # Max order ids per cancel request
+CANCEL_BATCH_ATTEMPTS = 2  # Batch attempts before cancelling one by one
+CANCEL_RETRY_DELAY = 0.25  # Seconds before the first batch retry (doubles per attempt)
+WS_STALE_AFTER = 5      # Seconds without a pushed mark price before falling back to REST
 
 # Additional Env Vars for Mode 2
 API_TOKEN = os.getenv("STANDX_API_TOKEN")
 API_KEY = os.getenv("STANDX_API_KEY")
 
+# Signing key encodings accepted for STANDX_API_KEY (32-byte Ed25519 key)
+HEX_CHARS = frozenset("0123456789abcdefABCDEF")
+BASE58_CHARS = frozenset("123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz")
+BASE64_KEY_PATTERN = re.compile(r"^[A-Za-z0-9+/]{43}=$")
+
+
+@lru_cache(maxsize=4)
+def decode_signing_key(raw_key: str) -> bytes:
+    """
+    Decodes a 32-byte signing key given as Hex, Base64 or Base58.
+    The encoding is detected from length and character set, so only one decoder runs.
+    Results are cached, so Mode 2 retries skip decoding.
+    """
+    key = raw_key.strip()
+    hex_key = key[2:] if key.startswith("0x") else key
+
+    if len(hex_key) == 64 and all(c in HEX_CHARS for c in hex_key):
+        private_key_bytes = bytes.fromhex(hex_key)
+    elif BASE64_KEY_PATTERN.match(key):
+        private_key_bytes = base64.b64decode(key)
+    elif len(key) in (43, 44) and all(c in BASE58_CHARS for c in key):
+        private_key_bytes = base58.b58decode(key)
+    else:
+        raise ValueError(f"Unrecognized API Key format (Length: {len(key)}). Check format (Hex, Base64, or Base58).")
+
+    if len(private_key_bytes) != 32:
+        raise ValueError(f"Could not decode API Key to 32 bytes (Length: {len(private_key_bytes)}). Check format (Hex, Base64, or Base58).")
+
+    return private_key_bytes
+
+
+@lru_cache(maxsize=4)
+def load_signing_auth(raw_key: str) -> StandXAuth:
+    """
+    Builds the StandXAuth instance for a persistent signing key.
+    Cached, so Mode 2 retries reuse the already constructed Ed25519 key.
+    """
+    return StandXAuth(private_key=decode_signing_key(raw_key), session=HTTP_SESSION)
+
 
 def get_auth_context_private_key():
     """Authenticates using Wallet Private Key (Mode 1)"""
@@ -120,10 +236,10 @@ def get_auth_context_private_key():
         return None
     
     logger.info("[Mode 1] Authenticating with Private Key...")
-    client = StandXPerpHTTP(base_url=API_BASE_URL, geo_url=GEO_API_URL)
+    client = StandXPerpHTTP(base_url=API_BASE_URL, geo_url=GEO_API_URL, session=HTTP_SESSION)
     
     # Generate ephemeral key for this session
-    auth = StandXAuth()
+    auth = StandXAuth(session=HTTP_SESSION)
     
     address, sign_func = get_signer(PRIVATE_KEY_HEX)
     logger.info(f"Wallet Address: {address}")
@@ -141,39 +257,177 @@ def get_auth_context_private_key():
         logger.error(f"Authentication failed: {e}")
         return None
 
-def cancel_all_open_orders(client, token, symbol, auth):
+def cancel_order_batch(client, token, order_ids, auth):
+    """
+    Cancel a batch of orders in one request, retrying the batch with backoff
+    before falling back to cancelling them one by one.
+    Returns True if every order in the batch was cancelled.
+    """
+    for attempt in range(CANCEL_BATCH_ATTEMPTS):
+        try:
+            client.cancel_orders(token, order_id_list=order_ids, auth=auth)
+            return True
+        except Exception as e:
+            logger.warning(f"Batch cancel of {len(order_ids)} orders failed (attempt {attempt + 1}): {e}")
+            time.sleep(CANCEL_RETRY_DELAY * 2 ** attempt)
+
+    # Fallback: one by one
+    failed_ids = []
+    for oid in order_ids:
+        try:
+            client.cancel_orders(token, order_id_list=[oid], auth=auth)
+        except Exception:
+            failed_ids.append(oid)
+
+    if failed_ids:
+        logger.error(f"Failed to cancel {len(failed_ids)} orders: {failed_ids}")
+    return not failed_ids
+
+def cancel_all_open_orders(client, token, symbol, auth, open_orders=None):
     """
     Helper to cancel all open orders for a symbol.
+    open_orders: already fetched query_open_orders result (queried if omitted).
+    Returns True if no open order is left (including when there was none),
+    False if some orders could not be cancelled.
     """
     try:
-        open_orders = client.query_open_orders(token, symbol=symbol)
+        if open_orders is None:
+            open_orders = client.query_open_orders(token, symbol=symbol)
         result_list = open_orders.get('result', [])
         
         if not result_list:
-            return False
+            return True
             
         ids_to_cancel = [o['id'] for o in result_list]
-        # Only log if we found something
-        if ids_to_cancel:
-            logger.info(f"Cancelling {len(ids_to_cancel)} open orders...")
-            
-            # Try batch cancel
-            try:
-                client.cancel_orders(token, order_id_list=ids_to_cancel, auth=auth)
-            except Exception:
-                # Fallback: one by one
-                for oid in ids_to_cancel:
-                    try:
-                        client.cancel_orders(token, order_id_list=[oid], auth=auth)
-                    except:
-                        pass
-            return True
-        return False
+        logger.info(f"Cancelling {len(ids_to_cancel)} open orders...")
+        
+        all_cancelled = True
+        for i in range(0, len(ids_to_cancel), CANCEL_BATCH_SIZE):
+            if not cancel_order_batch(client, token, ids_to_cancel[i:i + CANCEL_BATCH_SIZE], auth):
+                all_cancelled = False
+        return all_cancelled
     except Exception as e:
         logger.error(f"Error cancelling orders: {e}")
         return False
 
 
+def shutdown_cancel(client, token, symbol, auth):
+    """
+    Shutdown sequence: lets in-flight API calls (e.g. orders being placed when
+    Ctrl+C arrived) land, then cancels all open orders for the symbol.
+    """
+    try:
+        if not wait_for_pending_io(timeout=SHUTDOWN_IO_TIMEOUT):
+            logger.warning("Some API calls are still in flight. Cancelling anyway.")
+        logger.info("SHUTDOWN SEQUENCE: Cancelling all open orders...")
+        if not cancel_all_open_orders(client, token, symbol, auth):
+            logger.error("Some open orders could not be cancelled on exit. Check the StandX GUI!")
+    except Exception as cleanup_error:
+        logger.error(f"Failed to cleanup orders on exit: {cleanup_error}")
+
+
+def close_open_positions(client, token, symbol, auth, positions=None):
+    """
+    Helper to close any open position on a symbol via reduce-only market order.
+    positions: already fetched query_positions result (queried if omitted).
+    """
+    try:
+        if positions is None:
+            positions = client.query_positions(token, symbol=symbol)
+        # logger.info(f"Debug Positions: {positions}") # Uncomment if needed
+
+        # Index by symbol once instead of scanning the whole list per symbol.
+        # A symbol can hold several positions (e.g. cross and isolated), so keep them all.
+        positions_by_symbol = {}
+        for pos in positions:
+            positions_by_symbol.setdefault(pos.get('symbol'), []).append(pos)
+
+        has_position = False
+        for pos in positions_by_symbol.get(symbol, []):
+            qty = Decimal(str(pos.get('qty', 0)))
+            if qty != 0:
+                has_position = True
+                logger.warning(f"!!! OPEN POSITION DETECTED: {qty} {symbol} !!!")
+                logger.info("Attempting CLOSE via Market Order...")
+
+                close_side = "sell" if qty > 0 else "buy"
+                try:
+                    client.place_order(
+                        token=token,
+                        symbol=symbol,
+                        side=close_side,
+                        order_type="market",
+                        qty=format(abs(qty), 'f'),
+                        time_in_force="ioc",
+                        reduce_only=True,
+                        auth=auth,
+                        price=None
+                    )
+                    logger.info(">>> POSITION CLOSE ORDER SENT <<<")
+                except Exception as close_error:
+                    logger.error(f"FAILED to update position close order: {close_error}")
+
+        if not has_position:
+            # Optional: Log if clean
+            # logger.info("No open positions. Clean.")
+            pass
+
+    except Exception as e:
+        logger.error(f"CRITICAL ERROR in Position Check step: {e}")
+
+
+def get_price_tick(symbol_info: Dict[str, Any]) -> Decimal:
+    """
+    Extracts the price tick size from a query_symbol_info entry.
+    """
+    if symbol_info.get('tick_size') is not None:
+        return Decimal(str(symbol_info['tick_size']))
+    return Decimal(1).scaleb(-int(symbol_info['price_tick_decimals']))
+
+
+def round_to_tick(price: Decimal, tick: Decimal, rounding: str) -> str:
+    """
+    Rounds a price to a multiple of tick, formatted as a plain decimal string.
+    rounding: decimal rounding mode (ROUND_DOWN for bids, ROUND_UP for asks).
+    """
+    return format((price / tick).quantize(Decimal(1), rounding=rounding) * tick, 'f')
+
+
+def compute_quotes(mark_prices: List[Decimal], spread_factor: Decimal) -> Tuple[List[Decimal], List[Decimal]]:
+    """
+    Computes Bid/Ask prices at +/- spread_factor around each mark price.
+    Prices are kept as parallel lists (one entry per symbol).
+    """
+    bid_prices = [mark * (Decimal(1) - spread_factor) for mark in mark_prices]
+    ask_prices = [mark * (Decimal(1) + spread_factor) for mark in mark_prices]
+    return bid_prices, ask_prices
+
+
+def place_quotes(client, token, auth, symbols, bid_prices, ask_prices, qty):
+    """
+    Places a GTC limit Bid and Ask for every symbol, all dispatched concurrently.
+    bid_prices / ask_prices are the formatted price strings, aligned with symbols.
+    """
+    jobs = []
+    for symbol, bid_price, ask_price in zip(symbols, bid_prices, ask_prices):
+        for side, price in (("buy", bid_price), ("sell", ask_price)):
+            jobs.append(submit_io(
+                client.place_order,
+                token=token,
+                symbol=symbol,
+                side=side,
+                order_type="limit",
+                qty=qty,
+                price=price,
+                time_in_force="gtc",
+                reduce_only=False,
+                auth=auth
+            ))
+
+    # Wait for every order so a failure on one side still surfaces after the others are sent
+    for job in jobs:
+        job.result()
+
 
 def get_auth_context_api_token():
     """Uses provided API Token and Sign Key (Mode 2)"""
@@ -182,40 +436,11 @@ def get_auth_context_api_token():
         return None
 
     logger.info("[Mode 2] using API Token (Keyless)...")
-    client = StandXPerpHTTP(base_url=API_BASE_URL, geo_url=GEO_API_URL)
+    client = StandXPerpHTTP(base_url=API_BASE_URL, geo_url=GEO_API_URL, session=HTTP_SESSION)
 
     # Initialize Auth with the PERSISTENT signing key
     try:
-        raw_key = API_KEY.strip()
-        private_key_bytes = None
-
-        # Try 1: Hex
-        try:
-            k = raw_key
-            if k.startswith("0x"): k = k[2:]
-            private_key_bytes = bytes.fromhex(k)
-        except ValueError:
-            pass
-        
-        # Try 2: Base64
-        if not private_key_bytes or len(private_key_bytes) != 32:
-            try:
-                private_key_bytes = base64.b64decode(raw_key)
-            except Exception:
-                pass
-
-        # Try 3: Base58
-        if not private_key_bytes or len(private_key_bytes) != 32:
-            try:
-                private_key_bytes = base58.b58decode(raw_key)
-            except Exception:
-                pass
-        
-        # Check result
-        if not private_key_bytes or len(private_key_bytes) != 32:
-            raise ValueError(f"Could not decode API Key to 32 bytes (Length: {len(private_key_bytes) if private_key_bytes else 0}). Check format (Hex, Base64, or Base58).")
-
-        auth = StandXAuth(private_key=private_key_bytes)
+        auth = load_signing_auth(API_KEY)
         logger.info("Signing key loaded successfully.")
     except Exception as e:
         logger.error(f"Failed to load Signing Key: {e}")
@@ -257,7 +482,12 @@ def run_trading_bot():
         logger.error("Failed to initialize context. Exiting.")
         return
 
-    client = context['client']
+    # Every API call in the loop goes through a per-endpoint backoff / circuit breaker
+    breaker = CircuitBreaker()
+    client = GuardedClient(context['client'], breaker)
+    # Cancels bypass the breaker: cancel_order_batch has its own retry / per-id fallback,
+    # and stale orders must be pulled even while other calls are backing off
+    cancel_client = context['client']
     auth = context['auth']
     token = context['token']
     user_label = context['address']
@@ -280,8 +510,43 @@ def run_trading_bot():
     else:
         current_order_size = size_input
 
+    base_ccy = current_symbol.partition('-')[0]
+    # Decimal throughout so quotes land exactly on tick (8 / 10000 = 0.0008)
+    spread_factor = Decimal(SPREAD_BPS) / Decimal(10000)
+
+    # Prices are rounded to the symbol's tick size from the exchange metadata
+    try:
+        symbol_info = client.query_symbol_info(current_symbol)
+        price_ticks = {s['symbol']: get_price_tick(s) for s in symbol_info}
+        tick = price_ticks[current_symbol]
+    except Exception as e:
+        # Fallback: guess precision once from a reference price
+        # (4 decimals for small prices, 2 decimals otherwise)
+        logger.warning(f"Could not load tick size for {current_symbol} ({e}). Guessing from mark price.")
+        try:
+            reference_price = Decimal(str(client.query_symbol_price(current_symbol)['mark_price']))
+        except Exception as e:
+            logger.error(f"Failed to fetch reference price for {current_symbol}: {e}")
+            return
+        tick = Decimal("0.0001") if reference_price < 100 else Decimal("0.01")
+    logger.info(f"Price tick for {current_symbol}: {tick}")
+
+    # Open connections up front; the timings show the WAN latency to StandX
+    try:
+        timings = client.warm_up(current_symbol)
+        logger.info(f"API connections ready (perps: {timings['perps']:.0f} ms, geo: {timings['geo']:.0f} ms)")
+    except Exception as e:
+        logger.warning(f"Connection warm-up failed: {e}")
+
+    # Mark price is pushed over WebSocket; REST is only used when the stream is stale
+    price_stream = StandXPriceStream(current_symbol, ws_url=WS_STREAM_URL)
+    price_stream.start()
+
     logger.info(f"Starting Bot on {current_symbol} for user {user_label}...")
-    logger.info(f"Spread Target: {SPREAD_BPS} bps | Size: {current_order_size} {current_symbol.split('-')[0]}")
+    logger.info(f"Spread Target: {SPREAD_BPS} bps | Size: {current_order_size} {base_ccy}")
+    
+    # Deadline for the next refresh, kept on a fixed grid so cycle work doesn't stretch the period
+    next_tick = time.monotonic()
     
     try:
         while True:
@@ -292,137 +557,88 @@ def run_trading_bot():
                 now_minute = datetime.now().minute
                 if now_minute >= 45:
                     logger.info(f"Minute {now_minute} >= 45. Pausing to minimize fees (Target 45m uptime).")
-                    cancel_all_open_orders(client, token, current_symbol, auth)
+                    cancel_all_open_orders(cancel_client, token, current_symbol, auth)
                     time.sleep(60)
+                    next_tick = time.monotonic()
                     continue
 
-                # 1. Get Mark Price
-                price_data = client.query_symbol_price(current_symbol)
-                mark_price = float(price_data['mark_price'])
+                # 1. Get Mark Price (wait briefly for a fresh push so we don't quote on stale data)
+                price_stream.wait_for_update(timeout=1.0)
+                mark_value = price_stream.latest_mark_price(max_age=WS_STALE_AFTER)
+                if mark_value is None:
+                    logger.warning("Price stream is stale. Falling back to REST mark price.")
+                    mark_value = client.query_symbol_price(current_symbol)['mark_price']
+                # StandX returns prices as strings, parse them without going through float
+                mark_price = Decimal(str(mark_value))
                 
                 # 2. Calculate Bid/Ask Prices
                 # "within 10 bps of the spread" usually means distance from Mark/Mid.
                 # StandX docs: "within 10 bps of the spread" -> likely means (Price - Mark) / Mark <= 0.0010
                 # We stick to +/- 8 bps from Mark Price.
                 
-                spread_factor = SPREAD_BPS / 10000.0  # 8 / 10000 = 0.0008
-                bid_price = mark_price * (1 - spread_factor)
-                ask_price = mark_price * (1 + spread_factor)
+                bid_prices, ask_prices = compute_quotes([mark_price], spread_factor)
+                bid_price, ask_price = bid_prices[0], ask_prices[0]
                 
-                # Format prices to appropriate precision (StandX usually needs string)
-                # Assuming 1 tick size (adjust if needed, usually 0.1 or 1 for BTC)
-                # WARNING: Integers might not work for low value coins.
-                # We should probably use 2 decimals or dynamic precision.
-                # For safety/simplicity let's try to detect if price is small.
-                if mark_price < 100:
-                    # Use 4 decimals for small prices
-                    bid_price_str = f"{bid_price:.4f}"
-                    ask_price_str = f"{ask_price:.4f}"
-                else:
-                    # Use integer for large prices (like BTC) or 2 decimals
-                    # Safer to use valid tick size, but without metadata we guess.
-                    # Start with 2 decimals for generic, or int for very high?
-                    # Original code used int() which is bad for ETH/SOL.
-                    # Let's upgrade to 2 decimals default, or keep int for BTC specifically?
-                    bid_price_str = f"{bid_price:.2f}"
-                    ask_price_str = f"{ask_price:.2f}"
+                # Round prices to the symbol tick, away from the mark (StandX usually needs string)
+                bid_price_str = round_to_tick(bid_price, tick, ROUND_DOWN)
+                ask_price_str = round_to_tick(ask_price, tick, ROUND_UP)
                 
                 logger.info(f"Mark: {mark_price:.4f} | Target Bid: {bid_price_str} | Target Ask: {ask_price_str}")
 
-                # 3. Cancel Open Orders for this symbol
-                # Use our new helper
-                cancel_all_open_orders(client, token, current_symbol, auth)
-
-                # 4. Check & Auto-Close Positions (Delta Neutrality)
-                try:
-                    positions = client.query_positions(token, symbol=current_symbol)
-                    # logger.info(f"Debug Positions: {positions}") # Uncomment if needed
-                    
-                    has_position = False
-                    for pos in positions:
-                        if pos.get('symbol') == current_symbol:
-                            qty = float(pos.get('qty', 0))
-                            if qty != 0:
-                                has_position = True
-                                logger.warning(f"!!! OPEN POSITION DETECTED: {qty} {current_symbol} !!!")
-                                logger.info("Attempting CLOSE via Market Order...")
-                                
-                                close_side = "sell" if qty > 0 else "buy"
-                                try:
-                                    client.place_order(
-                                        token=token,
-                                        symbol=current_symbol,
-                                        side=close_side,
-                                        order_type="market",
-                                        qty=str(abs(qty)),
-                                        time_in_force="ioc",
-                                        reduce_only=True,
-                                        auth=auth,
-                                        price=None
-                                    )
-                                    logger.info(">>> POSITION CLOSE ORDER SENT <<<")
-                                except Exception as close_error:
-                                    logger.error(f"FAILED to update position close order: {close_error}")
-                    
-                    if not has_position:
-                        # Optional: Log if clean
-                        # logger.info("No open positions. Clean.")
-                        pass
-
-                except Exception as e:
-                    logger.error(f"CRITICAL ERROR in Position Check step: {e}")
-
-                # 5. Place New Orders
-                # Buy Order
-                client.place_order(
-                    token=token,
-                    symbol=current_symbol,
-                    side="buy",
-                    order_type="limit",
-                    qty=current_order_size,
-                    price=bid_price_str,
-                    time_in_force="gtc",
-                    reduce_only=False,
-                    auth=auth
+                # 3. Cancel Open Orders & 4. Check & Auto-Close Positions (Delta Neutrality)
+                # Fetch both together, then cancel and close concurrently
+                snapshot = client.query_account_snapshot(token, current_symbol, executor=EXECUTOR)
+                cancel_job = submit_io(
+                    cancel_all_open_orders, cancel_client, token, current_symbol, auth, snapshot['open_orders']
                 )
-                
-                # Sell Order
-                client.place_order(
-                    token=token,
-                    symbol=current_symbol,
-                    side="sell",
-                    order_type="limit",
-                    qty=current_order_size,
-                    price=ask_price_str,
-                    time_in_force="gtc",
-                    reduce_only=False,
-                    auth=auth
+                position_job = submit_io(
+                    close_open_positions, client, token, current_symbol, auth, snapshot['positions']
                 )
+                all_cancelled = cancel_job.result()
+                position_job.result()
+
+                # A quote can fill while the cancel is in flight, after the snapshot was taken:
+                # re-check positions now that the book is clear so it is hedged this cycle
+                close_open_positions(client, token, current_symbol, auth)
+
+                # 5. Place New Orders (Bid and Ask are independent, sent concurrently)
+                # Never stack new quotes on top of stale orders that failed to cancel
+                if all_cancelled:
+                    place_quotes(client, token, auth, [current_symbol], [bid_price_str], [ask_price_str], current_order_size)
+                    logger.info("Orders placed successfully.")
+                else:
+                    logger.error("Some open orders could not be cancelled. Skipping new quotes this cycle.")
                 
-                logger.info("Orders placed successfully.")
-                
-                # 6. Wait
-                time.sleep(REFRESH_RATE)
+                # 6. Wait until the next scheduled tick
+                next_tick += REFRESH_RATE
+                now = time.monotonic()
+                if now - next_tick > REFRESH_RATE:
+                    logger.warning(f"Refresh loop is {now - next_tick:.1f}s behind schedule. Resynchronizing.")
+                    next_tick = now + REFRESH_RATE
+                time.sleep(max(0.0, next_tick - now))
 
             except Exception as loop_error:
-                logger.error(f"Error in trading loop: {loop_error}")
-                time.sleep(5) # Wait a bit before retrying
+                # Wait a bit before retrying, longer while an endpoint is backing off
+                retry_delay = max(5, breaker.cooldown())
+                if isinstance(loop_error, CircuitOpenError):
+                    # Expected while an endpoint is backing off, no traceback needed
+                    logger.warning(f"Skipping cycle: {loop_error} (retrying in {retry_delay:.1f}s)")
+                else:
+                    logger.exception(f"Error in trading loop: {loop_error} (retrying in {retry_delay:.1f}s)")
+                time.sleep(retry_delay)
+                next_tick = time.monotonic()
 
     except KeyboardInterrupt:
         logger.info("Bot stopped by user. Cleaning up...")
     except Exception as e:
-        logger.critical(f"Fatal error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.critical(f"Fatal error: {e}", exc_info=True)
         logger.info("Emergency exit. Cleaning up...")
     finally:
+        price_stream.stop()
+        
         # ATTEMPT TO CANCEL ALL OPEN ORDERS ON STOP
         if context and client and token:
-            try:
-                logger.info("SHUTDOWN SEQUENCE: Cancelling all open orders...")
-                cancel_all_open_orders(client, token, current_symbol, auth)
-            except Exception as cleanup_error:
-                logger.error(f"Failed to cleanup orders on exit: {cleanup_error}")
+            shutdown_cancel(cancel_client, token, current_symbol, auth)
 
 if __name__ == "__main__":
     # Uncomment the function you want to run
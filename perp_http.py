@@ -3,9 +3,65 @@ StandX Perps HTTP API Client
 """
 from typing import Dict, Any, Optional, List
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import orjson
 import time
 import uuid
+from concurrent.futures import Executor
+
+
+def create_session(
+    base_url: str = "https://perps.standx.com",
+    geo_url: str = "https://geo.standx.com",
+    auth_url: str = "https://api.standx.com",
+    pool_connections: int = 10,
+    pool_maxsize: int = 40
+) -> requests.Session:
+    """
+    Create a requests.Session with connection pooling for the StandX hosts.
+
+    Reusing one session keeps TCP/TLS connections alive between calls instead
+    of paying a fresh handshake on every request.
+
+    Args:
+        base_url: Base URL for perps API
+        geo_url: Base URL for geo API
+        auth_url: Base URL for auth API
+        pool_connections: Number of connection pools to cache
+        pool_maxsize: Maximum number of keep-alive connections per host
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    # Only idempotent methods are retried by default, so order placement is never replayed
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=2, backoff_factor=0.1)
+    )
+    for url in (base_url, auth_url):
+        session.mount(url.rstrip('/'), adapter)
+    
+    # No retries on geo: get_region runs before every signed request and must stay
+    # within its single short timeout, falling back to local time instead
+    geo_adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=0
+    )
+    session.mount(geo_url.rstrip('/'), geo_adapter)
+    return session
+
+
+class HTTPError(ValueError):
+    """Non-2xx response from the StandX API"""
+    def __init__(self, status_code: int, text: str):
+        super().__init__(f"HTTP {status_code}: {text}")
+        self.status_code = status_code
+        self.text = text
 
 
 class RegionResponse:
@@ -18,16 +74,27 @@ class RegionResponse:
 class StandXPerpHTTP:
     """StandX Perps HTTP API Client"""
     
-    def __init__(self, base_url: str = "https://perps.standx.com", geo_url: str = "https://geo.standx.com"):
+    def __init__(
+        self,
+        base_url: str = "https://perps.standx.com",
+        geo_url: str = "https://geo.standx.com",
+        session: Optional[requests.Session] = None
+    ):
         """
         Initialize StandX Perps HTTP client.
         
         Args:
             base_url: Base URL for perps API (default: https://perps.standx.com)
             geo_url: Base URL for geo API (default: https://geo.standx.com)
+            session: Shared requests.Session (a pooled one is created if omitted)
         """
         self.base_url = base_url.rstrip('/')
         self.geo_url = geo_url.rstrip('/')
+        self.session = session or create_session(self.base_url, self.geo_url)
+    
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
     
     def health_check(self) -> str:
         """
@@ -37,13 +104,13 @@ class StandXPerpHTTP:
             "OK" string if healthy
             
         Raises:
-            ValueError: If request fails
+            HTTPError: If request fails
         """
         url = f"{self.base_url}/api/health"
-        response = requests.get(url)
+        response = self.session.get(url)
         
         if not response.ok:
-            raise ValueError(f"HTTP {response.status_code}: {response.text}")
+            raise HTTPError(response.status_code, response.text)
         
         return response.text.strip()
     
@@ -55,19 +122,47 @@ class StandXPerpHTTP:
             RegionResponse object with systemTime and region
             
         Raises:
-            ValueError: If request fails
+            HTTPError: If request fails
         """
         url = f"{self.geo_url}/v1/region"
         # Add a short timeout to avoid long blocking due to network issues
-        response = requests.get(url, timeout=1.0)
+        response = self.session.get(url, timeout=1.0)
         
         if not response.ok:
-            raise ValueError(f"HTTP {response.status_code}: {response.text}")
+            raise HTTPError(response.status_code, response.text)
         
-        data = response.json()
+        data = orjson.loads(response.content)
         region = RegionResponse(data)
         return region
 
+    def warm_up(self, symbol: str) -> Dict[str, float]:
+        """
+        Open pooled connections to the perps and geo hosts before trading starts,
+        so the first cycle doesn't pay DNS/TCP/TLS setup.
+        
+        Args:
+            symbol: Trading pair used for the perps request (e.g., "BTC-USD")
+            
+        Returns:
+            Dictionary with the time in milliseconds of each connection-opening request:
+            - perps: query_symbol_price round trip
+            - geo: get_region round trip
+            
+        Raises:
+            HTTPError: If a request fails
+        """
+        timings = {}
+        
+        start = time.perf_counter()
+        self.query_symbol_price(symbol)
+        timings["perps"] = (time.perf_counter() - start) * 1000
+        
+        start = time.perf_counter()
+        self.get_region()
+        timings["geo"] = (time.perf_counter() - start) * 1000
+        
+        return timings
+    
     def _get_sign_timestamp(self) -> int:
         """
         Get timestamp (seconds) to use for signing requests.
@@ -109,19 +204,19 @@ class StandXPerpHTTP:
             - pnl_freeze: 24h realized PnL
             
         Raises:
-            ValueError: If request fails
+            HTTPError: If request fails
         """
         url = f"{self.base_url}/api/query_balance"
         headers = {
             "Authorization": f"Bearer {token}"
         }
         
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers)
         
         if not response.ok:
-            raise ValueError(f"HTTP {response.status_code}: {response.text}")
+            raise HTTPError(response.status_code, response.text)
         
-        return response.json()
+        return orjson.loads(response.content)
     
     def place_order(
         self,
@@ -161,7 +256,7 @@ class StandXPerpHTTP:
             Response dictionary with code, message, and request_id
             
         Raises:
-            ValueError: If request fails
+            HTTPError: If request fails
         """
         url = f"{self.base_url}/api/new_order"
         payload = {
@@ -202,12 +297,12 @@ class StandXPerpHTTP:
         sign_headers = auth.sign_request(payload_str, request_id, timestamp)
         headers.update(sign_headers)
         
-        response = requests.post(url, headers=headers, data=payload_str)
+        response = self.session.post(url, headers=headers, data=payload_str)
         
         if not response.ok:
-            raise ValueError(f"HTTP {response.status_code}: {response.text}")
+            raise HTTPError(response.status_code, response.text)
         
-        return response.json()
+        return orjson.loads(response.content)
     
     def query_positions(
         self,
@@ -235,7 +330,7 @@ class StandXPerpHTTP:
             - and other fields...
             
         Raises:
-            ValueError: If request fails
+            HTTPError: If request fails
         """
         url = f"{self.base_url}/api/query_positions"
         headers = {
@@ -246,12 +341,12 @@ class StandXPerpHTTP:
         if symbol:
             params["symbol"] = symbol
         
-        response = requests.get(url, headers=headers, params=params)
+        response = self.session.get(url, headers=headers, params=params)
         
         if not response.ok:
-            raise ValueError(f"HTTP {response.status_code}: {response.text}")
+            raise HTTPError(response.status_code, response.text)
         
-        return response.json()
+        return orjson.loads(response.content)
     
     def query_symbol_price(
         self,
@@ -277,17 +372,52 @@ class StandXPerpHTTP:
             - time: Timestamp
             
         Raises:
-            ValueError: If request fails
+            HTTPError: If request fails
         """
         url = f"{self.base_url}/api/query_symbol_price"
         params = {"symbol": symbol}
         
-        response = requests.get(url, params=params)
+        response = self.session.get(url, params=params)
+        
+        if not response.ok:
+            raise HTTPError(response.status_code, response.text)
+        
+        return orjson.loads(response.content)
+    
+    def query_symbol_info(
+        self,
+        symbol: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Query symbol trading rules.
+        
+        Args:
+            symbol: Trading pair (optional, e.g., "BTC-USD"; all symbols if omitted)
+            
+        Returns:
+            List of symbol dictionaries with fields:
+            - symbol: Trading pair
+            - base_asset: Base currency
+            - quote_asset: Quote currency
+            - price_tick_decimals: Price precision (tick = 10^-decimals)
+            - qty_tick_decimals: Quantity precision
+            - min_order_qty: Minimum order quantity
+            - and other fields...
+            
+        Raises:
+            HTTPError: If request fails
+        """
+        url = f"{self.base_url}/api/query_symbol_info"
+        params = {}
+        if symbol:
+            params["symbol"] = symbol
+        
+        response = self.session.get(url, params=params)
         
         if not response.ok:
-            raise ValueError(f"HTTP {response.status_code}: {response.text}")
+            raise HTTPError(response.status_code, response.text)
         
-        return response.json()
+        return orjson.loads(response.content)
     
     def query_open_orders(
         self,
@@ -310,7 +440,7 @@ class StandXPerpHTTP:
             - total: Total number of orders
             
         Raises:
-            ValueError: If request fails
+            HTTPError: If request fails
         """
         url = f"{self.base_url}/api/query_open_orders"
         headers = {
@@ -323,12 +453,55 @@ class StandXPerpHTTP:
         if limit:
             params["limit"] = limit
         
-        response = requests.get(url, headers=headers, params=params)
+        response = self.session.get(url, headers=headers, params=params)
         
         if not response.ok:
-            raise ValueError(f"HTTP {response.status_code}: {response.text}")
+            raise HTTPError(response.status_code, response.text)
+        
+        return orjson.loads(response.content)
+    
+    def query_account_snapshot(
+        self,
+        token: str,
+        symbol: Optional[str] = None,
+        include_balance: bool = False,
+        executor: Optional[Executor] = None
+    ) -> Dict[str, Any]:
+        """
+        Query positions, open orders and (optionally) balance together.
+        
+        StandX has no combined account endpoint, so this issues the individual
+        queries, concurrently when an executor is given.
         
-        return response.json()
+        Args:
+            token: Authentication token
+            symbol: Trading pair (optional, e.g., "BTC-USD")
+            include_balance: Also query the balance
+            executor: Executor used to issue the queries concurrently
+            
+        Returns:
+            Dictionary with fields:
+            - positions: query_positions result
+            - open_orders: query_open_orders result
+            - balance: query_balance result (None unless include_balance)
+            
+        Raises:
+            HTTPError: If any of the queries fails
+        """
+        queries = {
+            "positions": (self.query_positions, token, symbol),
+            "open_orders": (self.query_open_orders, token, symbol),
+        }
+        if include_balance:
+            queries["balance"] = (self.query_balance, token)
+        
+        if executor:
+            jobs = {name: executor.submit(*query) for name, query in queries.items()}
+            snapshot = {name: job.result() for name, job in jobs.items()}
+        else:
+            snapshot = {name: query[0](*query[1:]) for name, query in queries.items()}
+        snapshot.setdefault("balance", None)
+        return snapshot
     
     def cancel_orders(
         self,
@@ -350,7 +523,8 @@ class StandXPerpHTTP:
             Empty list on success
             
         Raises:
-            ValueError: If request fails or neither order_id_list nor cl_ord_id_list is provided
+            HTTPError: If request fails
+            ValueError: If neither order_id_list nor cl_ord_id_list is provided
         """
         if not order_id_list and not cl_ord_id_list:
             raise ValueError("At least one of order_id_list or cl_ord_id_list is required")
@@ -379,12 +553,12 @@ class StandXPerpHTTP:
         sign_headers = auth.sign_request(payload_str, request_id, timestamp)
         headers.update(sign_headers)
         
-        response = requests.post(url, headers=headers, data=payload_str)
+        response = self.session.post(url, headers=headers, data=payload_str)
         
         if not response.ok:
-            raise ValueError(f"HTTP {response.status_code}: {response.text}")
+            raise HTTPError(response.status_code, response.text)
         
-        return response.json()
+        return orjson.loads(response.content)
     
     def query_positions(
         self,
@@ -412,7 +586,7 @@ class StandXPerpHTTP:
             - and other fields...
             
         Raises:
-            ValueError: If request fails
+            HTTPError: If request fails
         """
         url = f"{self.base_url}/api/query_positions"
         headers = {
@@ -423,9 +597,9 @@ class StandXPerpHTTP:
         if symbol:
             params["symbol"] = symbol
         
-        response = requests.get(url, headers=headers, params=params)
+        response = self.session.get(url, headers=headers, params=params)
         
         if not response.ok:
-            raise ValueError(f"HTTP {response.status_code}: {response.text}")
+            raise HTTPError(response.status_code, response.text)
         
-        return response.json()
+        return orjson.loads(response.content)
@@ -0,0 +1,127 @@
+"""
+StandX Perps WebSocket Market Stream Client
+"""
+from typing import Dict, Any, Optional
+import json
+import orjson
+import threading
+import time
+
+import websocket
+
+
+class StandXPriceStream:
+    """Background subscription to the StandX price channel for one symbol"""
+
+    def __init__(
+        self,
+        symbol: str,
+        ws_url: str = "wss://perps.standx.com/ws-stream/v1",
+        reconnect_delay: float = 1.0
+    ):
+        """
+        Initialize the price stream (call start() to connect).
+
+        Args:
+            symbol: Trading pair (e.g., "BTC-USD")
+            ws_url: Market stream URL (default: wss://perps.standx.com/ws-stream/v1)
+            reconnect_delay: Seconds to wait before reconnecting after a disconnect
+        """
+        self.symbol = symbol
+        self.ws_url = ws_url
+        self.reconnect_delay = reconnect_delay
+
+        self._lock = threading.Lock()
+        self._updated = threading.Event()
+        self._mark_price: Optional[str] = None
+        self._updated_at = 0.0
+        self._running = False
+        self._app: Optional[websocket.WebSocketApp] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Connect and keep the subscription alive on a daemon thread."""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"standx-ws-{self.symbol}",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Close the connection and stop reconnecting."""
+        self._running = False
+        if self._app:
+            self._app.close()
+
+    def wait_for_update(self, timeout: float) -> bool:
+        """
+        Block until a new mark price arrives or the timeout expires.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if a new mark price arrived
+        """
+        updated = self._updated.wait(timeout)
+        self._updated.clear()
+        return updated
+
+    def latest_mark_price(self, max_age: float) -> Optional[str]:
+        """
+        Get the last pushed mark price if it is fresh enough.
+
+        Args:
+            max_age: Maximum age in seconds of the last update
+
+        Returns:
+            Mark price as sent by the server (decimal string), or None if stale
+        """
+        with self._lock:
+            if self._mark_price is None or time.monotonic() - self._updated_at > max_age:
+                return None
+            return self._mark_price
+
+    def _run(self):
+        while self._running:
+            self._app = websocket.WebSocketApp(
+                self.ws_url,
+                on_open=self._on_open,
+                on_message=self._on_message
+            )
+            try:
+                self._app.run_forever(ping_interval=10, ping_timeout=5)
+            except Exception:
+                pass
+
+            if self._running:
+                time.sleep(self.reconnect_delay)
+
+    def _on_open(self, ws: websocket.WebSocketApp):
+        ws.send(json.dumps({"subscribe": {"channel": "price", "symbol": self.symbol}}))
+
+    def _on_message(self, ws: websocket.WebSocketApp, message: str):
+        try:
+            msg: Dict[str, Any] = orjson.loads(message)
+        except orjson.JSONDecodeError:
+            return
+
+        if msg.get("channel") != "price":
+            return
+
+        data = msg.get("data") or {}
+        if data.get("symbol", msg.get("symbol")) != self.symbol:
+            return
+
+        mark_price = data.get("mark_price")
+        if mark_price is None:
+            return
+
+        with self._lock:
+            self._mark_price = mark_price
+            self._updated_at = time.monotonic()
+        self._updated.set()
@@ -44,12 +44,13 @@ class LoginResponse:
 class StandXAuth:
     """StandX Authentication Client"""
     
-    def __init__(self, private_key: Optional[bytes] = None):
+    def __init__(self, private_key: Optional[bytes] = None, session: Optional[requests.Session] = None):
         """
         Initialize StandXAuth instance.
         
         Args:
             private_key: Optional 32-byte private key. If None, generates a new key pair.
+            session: Optional shared requests.Session to reuse connections
         """
         if private_key:
             if len(private_key) != 32:
@@ -65,6 +66,7 @@ class StandXAuth:
         )
         self.request_id = base58.b58encode(self._public_key_bytes).decode('utf-8')
         self.base_url = "https://api.standx.com"
+        self.session = session or requests.Session()
     
     def authenticate(
         self,
@@ -111,7 +113,7 @@ class StandXAuth:
             "requestId": self.request_id
         }
         
-        response = requests.post(
+        response = self.session.post(
             url,
             json=data,
             headers={"Content-Type": "application/json"}
@@ -156,7 +158,7 @@ class StandXAuth:
             "expiresSeconds": expires_seconds
         }
         
-        response = requests.post(
+        response = self.session.post(
             url,
             json=data,
             headers={"Content-Type": "application/json"}
@@ -233,6 +235,6 @@ class StandXAuth:
         )
     
     @classmethod
-    def from_private_key(cls, private_key: bytes) -> 'StandXAuth':
+    def from_private_key(cls, private_key: bytes, session: Optional[requests.Session] = None) -> 'StandXAuth':
         """Create StandXAuth instance from private key bytes"""
-        return cls(private_key=private_key)
\ No newline at end of file
+        return cls(private_key=private_key, session=session)
\ No newline at end of file
@@ -0,0 +1,126 @@
+"""
+Tests for the per-endpoint circuit breaker and its interaction with order cancellation
+"""
+import pytest
+
+import main
+from circuit_breaker import CircuitBreaker, CircuitOpenError, GuardedClient
+from perp_http import HTTPError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+class FakeClient:
+    """Records cancel requests and fails them while `failing` is set"""
+    def __init__(self, failing=True, status_code=503):
+        self.failing = failing
+        self.status_code = status_code
+        self.cancel_calls = []
+
+    def cancel_orders(self, token, order_id_list=None, cl_ord_id_list=None, auth=None):
+        self.cancel_calls.append(list(order_id_list))
+        if self.failing:
+            raise HTTPError(self.status_code, "unavailable")
+        return []
+
+
+OPEN_ORDERS = {"result": [{"id": 0}, {"id": 1}, {"id": 2}]}
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture(autouse=True)
+def no_cancel_retry_delay(monkeypatch):
+    monkeypatch.setattr(main, "CANCEL_RETRY_DELAY", 0.0)
+
+
+def test_retryable_failure_backs_off_endpoint(clock):
+    breaker = CircuitBreaker(clock=clock.monotonic)
+    client = GuardedClient(FakeClient(), breaker)
+
+    with pytest.raises(HTTPError):
+        client.cancel_orders("token", order_id_list=[1])
+
+    with pytest.raises(CircuitOpenError) as excinfo:
+        client.cancel_orders("token", order_id_list=[1])
+    assert excinfo.value.endpoint == "cancel_orders"
+    assert excinfo.value.retry_in == pytest.approx(1.0)
+    assert breaker.cooldown() == pytest.approx(1.0)
+
+
+def test_client_error_is_not_backed_off(clock):
+    breaker = CircuitBreaker(clock=clock.monotonic)
+    fake = FakeClient(status_code=400)
+    client = GuardedClient(fake, breaker)
+
+    for _ in range(3):
+        with pytest.raises(HTTPError):
+            client.cancel_orders("token", order_id_list=[1])
+
+    assert len(fake.cancel_calls) == 3
+    assert breaker.cooldown() == 0.0
+
+
+def test_circuit_opens_after_threshold_and_closes_on_success(clock):
+    breaker = CircuitBreaker(failure_threshold=3, open_seconds=30.0, clock=clock.monotonic)
+    fake = FakeClient()
+    client = GuardedClient(fake, breaker)
+
+    for _ in range(3):
+        with pytest.raises(HTTPError):
+            client.cancel_orders("token", order_id_list=[1])
+        clock.now += breaker.cooldown()
+    # Third failure opened the circuit; the clock was advanced past it above
+    assert len(fake.cancel_calls) == 3
+
+    # Half-open trial failure re-opens for the full open period
+    with pytest.raises(HTTPError):
+        client.cancel_orders("token", order_id_list=[1])
+    assert breaker.cooldown() == pytest.approx(30.0)
+
+    clock.now += 30.0
+    fake.failing = False
+    assert client.cancel_orders("token", order_id_list=[1]) == []
+    assert breaker.cooldown() == 0.0
+
+
+def test_cancel_retries_and_fallback_reach_server_and_report_failure():
+    fake = FakeClient()
+
+    assert main.cancel_all_open_orders(fake, "token", "BTC-USD", None, OPEN_ORDERS) is False
+    assert fake.cancel_calls == [[0, 1, 2], [0, 1, 2], [0], [1], [2]]
+
+
+def test_guarded_cancel_reports_failure_when_backing_off(clock):
+    client = GuardedClient(FakeClient(), CircuitBreaker(clock=clock.monotonic))
+
+    assert main.cancel_all_open_orders(client, "token", "BTC-USD", None, OPEN_ORDERS) is False
+
+
+def test_cancel_bypasses_breaker_backing_off_cancel_orders(clock):
+    fake = FakeClient()
+    breaker = CircuitBreaker(clock=clock.monotonic)
+    with pytest.raises(HTTPError):
+        GuardedClient(fake, breaker).cancel_orders("token", order_id_list=[9])
+    assert breaker.cooldown() > 0
+
+    # The loop cancels through the unguarded client, so the recovered server is reached
+    fake.failing = False
+    assert main.cancel_all_open_orders(fake, "token", "BTC-USD", None, OPEN_ORDERS) is True
+    assert fake.cancel_calls[-1] == [0, 1, 2]
+
+
+def test_no_open_orders_counts_as_cancelled():
+    fake = FakeClient()
+
+    assert main.cancel_all_open_orders(fake, "token", "BTC-USD", None, {"result": []}) is True
+    assert fake.cancel_calls == []
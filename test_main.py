@@ -0,0 +1,145 @@
+"""
+Tests for the trading bot helpers in main.py
+"""
+import signal
+import threading
+import time
+
+import base64
+from decimal import Decimal, ROUND_DOWN, ROUND_UP
+
+import base58
+import pytest
+from eth_account import Account
+from eth_account.messages import encode_defunct
+
+import main
+
+
+class FakeExchange:
+    """In-memory order book with a slow place_order, standing in for StandXPerpHTTP"""
+    def __init__(self, place_delay=0.0):
+        self.place_delay = place_delay
+        self.book = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def place_order(self, token, symbol, side, order_type, qty, time_in_force, reduce_only, price=None, auth=None):
+        time.sleep(self.place_delay)
+        with self._lock:
+            self.book[self._next_id] = side
+            self._next_id += 1
+        return {"code": 0}
+
+    def query_open_orders(self, token, symbol=None, limit=500):
+        with self._lock:
+            return {"result": [{"id": oid} for oid in self.book]}
+
+    def cancel_orders(self, token, order_id_list=None, cl_ord_id_list=None, auth=None):
+        with self._lock:
+            for oid in order_id_list:
+                self.book.pop(oid, None)
+        return []
+
+
+def test_shutdown_cancel_waits_for_orders_interrupted_mid_flight():
+    exchange = FakeExchange(place_delay=0.5)
+    main_thread = threading.main_thread().ident
+    # Real SIGINT to the main thread while it waits on the in-flight placements
+    threading.Timer(0.1, signal.pthread_kill, (main_thread, signal.SIGINT)).start()
+
+    with pytest.raises(KeyboardInterrupt):
+        main.place_quotes(exchange, "token", None, ["BTC-USD"], ["99.0"], ["101.0"], "0.001")
+
+    main.shutdown_cancel(exchange, "token", "BTC-USD", None)
+
+    # Any placement still running after the cancel would land now
+    time.sleep(exchange.place_delay * 2)
+    assert exchange.book == {}
+
+
+@pytest.mark.parametrize("private_key_hex", [
+    "4c0883a69102937d6231471b5dbb6204fe5129617082792ae468d01a3f362318",
+    "0x4c0883a69102937d6231471b5dbb6204fe5129617082792ae468d01a3f362318",
+])
+@pytest.mark.parametrize("message", [
+    "standx.com wants you to sign in with your Ethereum account",
+    # Multi-byte characters: the EIP-191 length prefix counts bytes, not characters
+    "Connexion à StandX ✓ — nonce: 8f3a 以太坊",
+])
+def test_signer_matches_eth_account(private_key_hex, message):
+    address, sign_message = main.get_signer(private_key_hex)
+    reference = Account.from_key(private_key_hex)
+    expected = reference.sign_message(encode_defunct(text=message)).signature
+
+    assert address == reference.address
+    assert sign_message(message) == "0x" + bytes(expected).hex()
+
+
+KEY_43 = bytes([1] * 32)      # Base58-encodes to 43 chars
+KEY_44 = bytes([0xff] * 32)   # Base58-encodes to 44 chars
+
+
+@pytest.mark.parametrize("raw_key, expected", [
+    (KEY_44.hex(), KEY_44),
+    ("0x" + KEY_43.hex(), KEY_43),
+    (KEY_44.hex().upper(), KEY_44),
+    (base64.b64encode(KEY_43).decode(), KEY_43),
+    (base58.b58encode(KEY_43).decode(), KEY_43),
+    (base58.b58encode(KEY_44).decode(), KEY_44),
+    ("  " + KEY_43.hex() + "\n", KEY_43),
+])
+def test_decode_signing_key_formats(raw_key, expected):
+    assert main.decode_signing_key(raw_key) == expected
+
+
+def test_decode_signing_key_base58_lengths_are_covered():
+    assert len(base58.b58encode(KEY_43)) == 43
+    assert len(base58.b58encode(KEY_44)) == 44
+
+
+@pytest.mark.parametrize("raw_key, error", [
+    ("", "Unrecognized"),
+    (KEY_43.hex()[:-2], "Unrecognized"),                   # 62-char hex
+    ("g" + KEY_43.hex()[1:], "Unrecognized"),               # 64 chars, not hex
+    ("0" + base58.b58encode(KEY_44).decode()[1:], "Unrecognized"),  # '0' is not Base58
+    ("+" * 43, "Unrecognized"),                             # Base64 alphabet, no padding
+    ("z" * 44, "32 bytes"),                                 # valid Base58, decodes to 33 bytes
+])
+def test_decode_signing_key_rejects(raw_key, error):
+    with pytest.raises(ValueError, match=error):
+        main.decode_signing_key(raw_key)
+
+
+@pytest.mark.parametrize("symbol_info, tick", [
+    ({"symbol": "ETH-USD", "tick_size": "0.5"}, Decimal("0.5")),
+    ({"symbol": "BTC-USD", "price_tick_decimals": 2}, Decimal("0.01")),
+    ({"symbol": "XRP-USD", "price_tick_decimals": "4"}, Decimal("0.0001")),
+    ({"symbol": "BTC-USD", "price_tick_decimals": 0}, Decimal("1")),
+])
+def test_get_price_tick(symbol_info, tick):
+    assert main.get_price_tick(symbol_info) == tick
+
+
+@pytest.mark.parametrize("price, tick, rounding, expected", [
+    (Decimal("3001.3"), Decimal("0.5"), ROUND_DOWN, "3001.0"),
+    (Decimal("3001.3"), Decimal("0.5"), ROUND_UP, "3001.5"),
+    (Decimal("3001.5"), Decimal("0.5"), ROUND_UP, "3001.5"),
+    (Decimal("67891.0123"), Decimal("0.01"), ROUND_DOWN, "67891.01"),
+    (Decimal("67891.0123"), Decimal("0.01"), ROUND_UP, "67891.02"),
+    (Decimal("68001.3"), Decimal("1"), ROUND_DOWN, "68001"),
+])
+def test_round_to_tick(price, tick, rounding, expected):
+    assert main.round_to_tick(price, tick, rounding) == expected
+
+
+def test_quotes_stay_outside_target_spread():
+    mark = Decimal("67945.37")
+    spread_factor = Decimal(8) / Decimal(10000)
+    (bid,), (ask,) = main.compute_quotes([mark], spread_factor)
+
+    bid_str = main.round_to_tick(bid, Decimal("0.01"), ROUND_DOWN)
+    ask_str = main.round_to_tick(ask, Decimal("0.01"), ROUND_UP)
+
+    assert (bid_str, ask_str) == ("67891.01", "67999.73")
+    assert Decimal(bid_str) <= bid and Decimal(ask_str) >= ask
@@ -0,0 +1,51 @@
+"""
+Tests for the StandX Perps HTTP client
+"""
+import socket
+import threading
+import time
+
+from perp_http import StandXPerpHTTP, create_session
+
+
+def test_session_retries_perps_but_not_geo():
+    session = create_session("https://perps.example", "https://geo.example", "https://auth.example")
+
+    assert session.get_adapter("https://perps.example/api/new_order").max_retries.total == 2
+    assert session.get_adapter("https://auth.example/v1/offchain/login").max_retries.total == 2
+    assert session.get_adapter("https://geo.example/v1/region").max_retries.total == 0
+
+
+def test_sign_timestamp_falls_back_within_region_timeout():
+    # Server that accepts connections but never responds
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    accepted = []
+
+    def accept():
+        while True:
+            try:
+                accepted.append(server.accept()[0])
+            except OSError:
+                return
+
+    threading.Thread(target=accept, daemon=True).start()
+    geo_url = f"http://127.0.0.1:{server.getsockname()[1]}"
+    client = StandXPerpHTTP(
+        base_url="http://perps.invalid",
+        geo_url=geo_url,
+        session=create_session("http://perps.invalid", geo_url, "http://auth.invalid")
+    )
+
+    try:
+        start = time.monotonic()
+        timestamp = client._get_sign_timestamp()
+        elapsed = time.monotonic() - start
+    finally:
+        server.close()
+        for conn in accepted:
+            conn.close()
+
+    assert abs(timestamp - time.time()) < 5
+    assert elapsed < 2.0